@@ -55,14 +55,44 @@ class Statement(NodeNG):
     is_statement = True
     """Whether this node indicates a statement."""
 
+    _sibling_position: tuple[str, int] | None = None
+    """The field of the parent holding this statement and its index in it."""
+
+    def _sibling_statements(self) -> tuple[list[NodeNG], int]:
+        """Get the sequence of statements containing this one and its index.
+
+        The position is memoized on all the siblings at once, so that walking
+        through a block statement by statement doesn't rescan the block for
+        every step. It is checked against the parent before being reused, in
+        case the tree was modified in the meantime.
+        """
+        if self._sibling_position is not None:
+            field, index = self._sibling_position
+            stmts = getattr(self.parent, field, None)
+            if (
+                isinstance(stmts, list)
+                and index < len(stmts)
+                and stmts[index] is self
+            ):
+                return stmts, index
+
+        field, stmts = self.parent.locate_child(self)
+        if stmts is self:
+            return [self], 0
+        index = stmts.index(self)
+        if isinstance(stmts, list):
+            for position, sibling in enumerate(stmts):
+                if isinstance(sibling, Statement):
+                    sibling._sibling_position = (field, position)
+        return stmts, index
+
     def next_sibling(self):
         """The next sibling statement node.
 
         :returns: The next sibling statement node.
         :rtype: NodeNG or None
         """
-        stmts = self.parent.child_sequence(self)
-        index = stmts.index(self)
+        stmts, index = self._sibling_statements()
         try:
             return stmts[index + 1]
         except IndexError:
@@ -74,8 +104,7 @@ class Statement(NodeNG):
         :returns: The previous sibling statement node.
         :rtype: NodeNG or None
         """
-        stmts = self.parent.child_sequence(self)
-        index = stmts.index(self)
+        stmts, index = self._sibling_statements()
         if index >= 1:
             return stmts[index - 1]
         return None
@@ -194,16 +194,26 @@ def are_exclusive(stmt1, stmt2, exceptions: list[str] | None = None) -> bool:
 # getitem() helpers.
 
 _SLICE_SENTINEL = object()
+_SLICE_INDEX_TYPES = (int, type(None))
 
 
 def _slice_value(index, context: InferenceContext | None = None):
     """Get the value of the given slice index."""
 
+    # Unspecified bounds and literal integers make up most slices,
+    # handle them without going through inference.
+    if index is None:
+        return None
     if isinstance(index, Const):
-        if isinstance(index.value, (int, type(None))):
+        if isinstance(index.value, _SLICE_INDEX_TYPES):
             return index.value
-    elif index is None:
-        return None
+    elif (
+        isinstance(index, UnaryOp)
+        and index.op == "-"
+        and isinstance(index.operand, Const)
+        and isinstance(index.operand.value, int)
+    ):
+        return -index.operand.value
     else:
         # Try to infer what the index actually is.
         # Since we can't return all the possible values,
@@ -214,7 +224,7 @@ def _slice_value(index, context: InferenceContext | None = None):
             pass
         else:
             if isinstance(inferred, Const):
-                if isinstance(inferred.value, (int, type(None))):
+                if isinstance(inferred.value, _SLICE_INDEX_TYPES):
                     return inferred.value
 
     # Use a sentinel, because None can be a valid
@@ -241,14 +251,15 @@ def _infer_slice(node, context: InferenceContext | None = None):
 def _container_getitem(instance, elts, index, context: InferenceContext | None = None):
     """Get a slice or an item, using the given *index*, for the given sequence."""
     try:
+        # Plain constant indexes are far more common than slices, check them first.
+        if isinstance(index, Const):
+            return elts[index.value]
         if isinstance(index, Slice):
             index_slice = _infer_slice(index, context=context)
             new_cls = instance.__class__()
             new_cls.elts = elts[index_slice]
             new_cls.parent = instance.parent
             return new_cls
-        if isinstance(index, Const):
-            return elts[index.value]
     except ValueError as exc:
         raise AstroidValueError(
             message="Slice {index!r} cannot index container",
@@ -813,6 +824,22 @@ class Arguments(
 
         return retval
 
+    @cached_property
+    def _positional_and_keyword(self) -> list[AssignName]:
+        """All the arguments, except the variable length ones (*args and **kwargs)."""
+        variadic_names = {self.vararg, self.kwarg}
+        return [arg for arg in self.arguments if arg.name not in variadic_names]
+
+    @cached_property
+    def _arguments_index(self) -> dict[str, int]:
+        """Map the name of each argument to its position in :attr:`arguments`."""
+        return _index_args(self.arguments)
+
+    @cached_property
+    def _positional_and_keyword_index(self) -> dict[str, int]:
+        """Map the name of each non-variadic argument to its position."""
+        return _index_args(self._positional_and_keyword)
+
     def format_args(self, *, skippable_names: set[str] | None = None) -> str:
         """Get the arguments formatted as string.
 
@@ -941,9 +968,7 @@ class Arguments(
         :raises NoDefault: If there is no default value defined for the
             given argument.
         """
-        args = [
-            arg for arg in self.arguments if arg.name not in [self.vararg, self.kwarg]
-        ]
+        args = self._positional_and_keyword
 
         index = _find_arg(argname, self.kwonlyargs)[0]
         if (index is not None) and (len(self.kw_defaults) > index):
@@ -951,7 +976,7 @@ class Arguments(
                 return self.kw_defaults[index]
             raise NoDefault(func=self.parent, name=argname)
 
-        index = _find_arg(argname, args)[0]
+        index = self._positional_and_keyword_index.get(argname)
         if index is not None:
             idx = index - (len(args) - len(self.defaults) - len(self.kw_defaults))
             if idx >= 0:
@@ -989,9 +1014,9 @@ class Arguments(
                 stacklevel=2,
             )
         if self.arguments:
-            index, argument = _find_arg(argname, self.arguments)
-            if argument:
-                return index, argument
+            index = self._arguments_index.get(argname)
+            if index is not None:
+                return index, self.arguments[index]
         return None, None
 
     def get_children(self):
@@ -1044,6 +1069,14 @@ def _find_arg(argname, args):
     return None, None
 
 
+def _index_args(args) -> dict[str, int]:
+    """Map argument names to their first position in *args*, like _find_arg."""
+    index: dict[str, int] = {}
+    for i, arg in enumerate(args):
+        index.setdefault(arg.name, i)
+    return index
+
+
 def _format_args(
     args, defaults=None, annotations=None, skippable_names: set[str] | None = None
 ) -> str:
@@ -2096,6 +2129,11 @@ class Const(_base_nodes.NoChildrenNode, Instance):
         :raises AstroidTypeError: When the given index cannot be used as a
             subscript index, or if this node is not subscriptable.
         """
+        # Only str and bytes constants are subscriptable, check this before
+        # doing any work on the index, which could involve inference.
+        if not isinstance(self.value, (str, bytes)):
+            raise AstroidTypeError(f"{self!r} (value={self.value})")
+
         if isinstance(index, Const):
             index_value = index.value
         elif isinstance(index, Slice):
@@ -2107,8 +2145,7 @@ class Const(_base_nodes.NoChildrenNode, Instance):
             )
 
         try:
-            if isinstance(self.value, (str, bytes)):
-                return Const(self.value[index_value])
+            return Const(self.value[index_value])
         except ValueError as exc:
             raise AstroidValueError(
                 f"Could not index {self.value!r} with {index_value!r}"
@@ -2125,8 +2162,6 @@ class Const(_base_nodes.NoChildrenNode, Instance):
                 message="Type error {error!r}", node=self, index=index, context=context
             ) from exc
 
-        raise AstroidTypeError(f"{self!r} (value={self.value})")
-
     def has_dynamic_getattr(self) -> bool:
         """Check if the node has a custom __getattr__ or __getattribute__.
 
@@ -2386,6 +2421,24 @@ class Dict(NodeNG, Instance):
         """
         return [key for (key, _) in self.items]
 
+    @cached_property
+    def _const_items(self) -> dict[Any, InferenceResult] | None:
+        """The values of this dictionary keyed by the value of their key.
+
+        This is only available when every key is a :class:`Const`, which lets
+        :meth:`getitem` skip inferring each key. As with the generic lookup,
+        the first of several equal keys wins.
+        """
+        const_items: dict[Any, InferenceResult] = {}
+        for key, value in self.items:
+            if not isinstance(key, Const):
+                return None
+            try:
+                const_items.setdefault(key.value, value)
+            except TypeError:
+                return None
+        return const_items
+
     def getitem(
         self, index: Const | Slice, context: InferenceContext | None = None
     ) -> NodeNG:
@@ -2398,6 +2451,18 @@ class Dict(NodeNG, Instance):
         :raises AstroidIndexError: If the given index does not exist in the
             dictionary.
         """
+        # Only constant indexes can match a regular key, so don't bother
+        # inferring the keys for anything else.
+        index_is_const = isinstance(index, Const)
+        if index_is_const and self._const_items is not None:
+            try:
+                return self._const_items[index.value]
+            except KeyError:
+                raise AstroidIndexError(index) from None
+            except TypeError:
+                # Unhashable index value, fall back to comparing every key.
+                pass
+
         for key, value in self.items:
             # TODO(cpopa): no support for overriding yet, {1:2, **{1: 3}}.
             if isinstance(key, DictUnpack):
@@ -2410,10 +2475,12 @@ class Dict(NodeNG, Instance):
                 except (AstroidTypeError, AstroidIndexError):
                     continue
 
+            if not index_is_const:
+                continue
             for inferredkey in key.infer(context):
                 if isinstance(inferredkey, util.UninferableBase):
                     continue
-                if isinstance(inferredkey, Const) and isinstance(index, Const):
+                if isinstance(inferredkey, Const):
                     if inferredkey.value == index.value:
                         return value
 
@@ -2644,7 +2711,14 @@ class ExceptHandler(
         """
         if self.type is None or exceptions is None:
             return True
-        return any(node.name in exceptions for node in self.type._get_name_nodes())
+        return not self._exception_names.isdisjoint(exceptions)
+
+    @cached_property
+    def _exception_names(self) -> frozenset[str]:
+        """The names used in the types that the block handles."""
+        if self.type is None:
+            return frozenset()
+        return frozenset(node.name for node in self.type._get_name_nodes())
 
 
 class For(
@@ -3450,11 +3524,27 @@ class Raise(_base_nodes.Statement):
 
         :returns: Whether this node raises a :class:`NotImplementedError`.
         """
-        if not self.exc:
+        exc = self.exc
+        if not exc:
             return False
-        return any(
-            name.name == "NotImplementedError" for name in self.exc._get_name_nodes()
-        )
+        # Handle the common ``raise NotImplementedError`` and
+        # ``raise NotImplementedError(...)`` forms without walking the subtree.
+        if isinstance(exc, Name):
+            return exc.name == "NotImplementedError"
+        if (
+            isinstance(exc, Call)
+            and isinstance(exc.func, Name)
+            and exc.func.name == "NotImplementedError"
+        ):
+            return True
+        return "NotImplementedError" in self._exc_names
+
+    @cached_property
+    def _exc_names(self) -> frozenset[str]:
+        """The names used in the raised exception expression."""
+        if self.exc is None:
+            return frozenset()
+        return frozenset(node.name for node in self.exc._get_name_nodes())
 
     def get_children(self):
         if self.exc is not None:
@@ -3511,6 +3601,10 @@ class Set(BaseContainer):
         return "builtins.set"
 
 
+# Maps the attributes of a runtime slice object to the Slice fields holding them.
+_SLICE_ATTRIBUTE_FIELDS = {"start": "lower", "stop": "upper", "step": "step"}
+
+
 class Slice(NodeNG):
     """Class representing an :class:`ast.Slice` node.
 
@@ -3551,10 +3645,8 @@ class Slice(NodeNG):
             return const
         return attr
 
-    @cached_property
-    def _proxied(self) -> nodes.ClassDef:
-        builtins = AstroidManager().builtins_module
-        return builtins.getattr("slice")[0]
+    _proxied: nodes.ClassDef
+    """The builtin ``slice`` class, set during bootstrapping."""
 
     def pytype(self) -> Literal["builtins.slice"]:
         """Get the name of the type that this node represents.
@@ -3579,12 +3671,9 @@ class Slice(NodeNG):
 
         :returns: The inferred possible values.
         """
-        if attrname == "start":
-            yield self._wrap_attribute(self.lower)
-        elif attrname == "stop":
-            yield self._wrap_attribute(self.upper)
-        elif attrname == "step":
-            yield self._wrap_attribute(self.step)
+        field = _SLICE_ATTRIBUTE_FIELDS.get(attrname)
+        if field is not None:
+            yield self._wrap_attribute(getattr(self, field))
         else:
             yield from self.getattr(attrname, context=context)
 
@@ -4295,8 +4384,6 @@ class UnaryOp(_base_nodes.OperatorNode):
         InferenceResult | util.BadUnaryOperationMessage, None, InferenceErrorInfo
     ]:
         """Infer what an UnaryOp should return when evaluated."""
-        from astroid.nodes import ClassDef  # pylint: disable=import-outside-toplevel
-
         for operand in self.operand.infer(context):
             try:
                 yield operand.infer_unary_op(self.op)
@@ -4315,6 +4402,11 @@ class UnaryOp(_base_nodes.OperatorNode):
                     else:
                         yield util.Uninferable
                 else:
+                    # Only needed for operands without a builtin implementation,
+                    # so keep the import off the path of every unary operation.
+                    # pylint: disable-next=import-outside-toplevel
+                    from astroid.nodes import ClassDef
+
                     if not isinstance(operand, (Instance, ClassDef)):
                         # The operation was used on something which
                         # doesn't support it.
@@ -5393,7 +5485,7 @@ class MatchOr(Pattern):
 # constants ##############################################################
 
 # The _proxied attribute of all container types (List, Tuple, etc.)
-# are set during bootstrapping by _astroid_bootstrapping().
+# and of Slice are set during bootstrapping by _astroid_bootstrapping().
 CONST_CLS: dict[type, type[NodeNG]] = {
     list: List,
     tuple: Tuple,
@@ -184,7 +184,10 @@ class NodeNG:
 
         This is either :attr:`name`, :attr:`attrname`, or the empty string.
         """
-        if all(name not in self._astroid_fields for name in ("name", "attrname")):
+        if (
+            "name" not in self._astroid_fields
+            and "attrname" not in self._astroid_fields
+        ):
             return getattr(self, "name", "") or getattr(self, "attrname", "")
         return ""
 
@@ -251,7 +254,7 @@ class NodeNG:
 
     def last_child(self) -> NodeNG | None:
         """An optimized version of list(get_children())[-1]."""
-        for field in self._astroid_fields[::-1]:
+        for field in reversed(self._astroid_fields):
             attr = getattr(self, field)
             if not attr:  # None or empty list / tuple
                 continue
@@ -14,7 +14,7 @@ import operator as operator_mod
 from collections.abc import Callable, Generator, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from astroid import bases, decorators, nodes, util
+from astroid import arguments, bases, decorators, nodes, util
 from astroid.const import Context
 from astroid.context import InferenceContext, copy_context
 from astroid.exceptions import (
@@ -350,13 +350,11 @@ def _arguments_infer_argname(
 ) -> Generator[InferenceResult, None, None]:
     # arguments information may be missing, in which case we can't do anything
     # more
-    from astroid import arguments  # pylint: disable=import-outside-toplevel
-
     if not self.arguments:
         yield util.Uninferable
         return
 
-    args = [arg for arg in self.arguments if arg.name not in [self.vararg, self.kwarg]]
+    args = self._positional_and_keyword
     functype = self.parent.type
     # first argument of instance/class method
     if (
@@ -415,8 +413,6 @@ def arguments_assigned_stmts(
     context: InferenceContext | None = None,
     assign_path: list[int] | None = None,
 ) -> Any:
-    from astroid import arguments  # pylint: disable=import-outside-toplevel
-
     try:
         node_name = node.name  # type: ignore[union-attr]
     except AttributeError:
@@ -624,6 +624,10 @@ def _astroid_bootstrapping() -> None:
     # Set the builtin module as parent for some builtins.
     nodes.Const._proxied = property(_set_proxied)
 
+    slice_proxy = astroid_builtin.getattr("slice")[0]
+    assert isinstance(slice_proxy, nodes.ClassDef)
+    nodes.Slice._proxied = slice_proxy
+
     _GeneratorType = nodes.ClassDef(
         types.GeneratorType.__name__,
         lineno=0,
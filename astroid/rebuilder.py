@@ -711,7 +711,8 @@ class TreeRebuilder:
     def visit_augassign(self, node: ast.AugAssign, parent: NodeNG) -> nodes.AugAssign:
         """Visit a AugAssign node by returning a fresh instance of it."""
         newnode = nodes.AugAssign(
-            op=self._parser_module.bin_op_classes[type(node.op)] + "=",
+            # Share a single string per operator rather than one per node.
+            op=sys.intern(self._parser_module.bin_op_classes[type(node.op)] + "="),
             lineno=node.lineno,
             col_offset=node.col_offset,
             end_lineno=node.end_lineno,
@@ -3677,6 +3677,8 @@ class InferenceTest(resources.SysPathSetup, unittest.TestCase):
             ("[1, 2, 3][None:] #@", [1, 2, 3]),
             ("[1, 2, 3][None:None] #@", [1, 2, 3]),
             ("[1, 2, 3][0:-1] #@", [1, 2]),
+            ("[1, 2, 3][-2:] #@", [2, 3]),
+            ("[1, 2, 3][True:] #@", [2, 3]),
             ("[1, 2, 3][0:2] #@", [1, 2]),
             ("[1, 2, 3][0:2:None] #@", [1, 2]),
             ("[1, 2, 3][::] #@", [1, 2, 3]),
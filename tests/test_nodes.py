@@ -32,7 +32,9 @@ from astroid.const import IS_PYPY, PY310_PLUS, PY312_PLUS, Context
 from astroid.context import InferenceContext
 from astroid.exceptions import (
     AstroidBuildingError,
+    AstroidIndexError,
     AstroidSyntaxError,
+    AstroidTypeError,
     AttributeInferenceError,
     ParentMissingError,
     StatementMissing,
@@ -665,6 +667,15 @@ class ConstNodeTest(unittest.TestCase):
         const = copy.copy(nodes.Const(1))
         assert const.value == 1
 
+    def test_getitem(self) -> None:
+        node = nodes.Const("abc")
+        assert node.getitem(nodes.Const(1)).value == "b"
+        assert node.getitem(nodes.Const(-1)).value == "c"
+        with self.assertRaises(AstroidTypeError):
+            node.getitem(nodes.Name("x", 1, 0, None, end_lineno=1, end_col_offset=1))
+        with self.assertRaises(AstroidTypeError):
+            nodes.Const(1).getitem(nodes.Const(0))
+
 
 class NameNodeTest(unittest.TestCase):
     def test_assign_to_true(self) -> None:
@@ -891,6 +902,23 @@ class ArgumentsNodeTC(unittest.TestCase):
         assert isinstance(args.kw_defaults[0], nodes.Const)
         assert args.kw_defaults[0].value == "default"
 
+    def test_find_argname(self) -> None:
+        ast = builder.parse(
+            """
+            def func(a, /, b, *args, c=1, **kwargs):
+                pass
+        """
+        )
+        args = ast["func"].args
+        for expected_index, name in enumerate(("a", "b", "args", "c", "kwargs")):
+            index, argument = args.find_argname(name)
+            assert index == expected_index
+            assert argument.name == name
+            assert args.is_argument(name)
+        assert args.find_argname("d") == (None, None)
+        assert not args.is_argument("d")
+        assert args.default_value("c").value == 1
+
     def test_positional_only(self):
         ast = builder.parse(
             """
@@ -2023,3 +2051,93 @@ def test_arguments_default_value():
 
     node = extract_node("def fruit(seeds, flavor='good', *, peel='maybe'): ...")
     assert node.args.default_value("flavor").value == "good"
+
+
+def test_dict_getitem() -> None:
+    node = extract_node("{'a': 1, 'b': 2, 'a': 3}")
+    assert node.getitem(nodes.Const("b")).value == 2
+    # The first of several equal keys is the one being found.
+    assert node.getitem(nodes.Const("a")).value == 1
+    with pytest.raises(AstroidIndexError):
+        node.getitem(nodes.Const("c"))
+
+    node = extract_node("{'a': 1, **{'b': 2}}")
+    assert node.getitem(nodes.Const("b")).value == 2
+    with pytest.raises(AstroidIndexError):
+        node.getitem(nodes.Const("c"))
+
+
+def test_statement_siblings_after_tree_modification() -> None:
+    module = parse("a = 1\nb = 2\nc = 3\n")
+    first, second, third = module.body
+    assert first.next_sibling() is second
+    assert third.previous_sibling() is second
+
+    inserted = extract_node("d = 4")
+    inserted.parent = module
+    module.body.insert(1, inserted)
+    assert first.next_sibling() is inserted
+    assert second.previous_sibling() is inserted
+    assert third.previous_sibling() is second
+
+    module.body = [third, first]
+    assert third.next_sibling() is first
+    assert first.previous_sibling() is third
+    assert first.next_sibling() is None
+
+
+def test_excepthandler_catch() -> None:
+    node = extract_node(
+        """
+        try:
+            pass
+        except (ValueError, KeyError):
+            pass
+        except:
+            pass
+        """
+    )
+    typed_handler, bare_handler = node.handlers
+    assert typed_handler.catch(["KeyError", "IndexError"])
+    assert typed_handler.catch(["ValueError"])
+    assert not typed_handler.catch(["IndexError"])
+    assert not typed_handler.catch([])
+    assert typed_handler.catch(None)
+    assert bare_handler.catch(["IndexError"])
+
+
+def test_slice_proxied() -> None:
+    first, second = extract_node(
+        """
+        x[1:2] #@
+        x[::3] #@
+        """
+    )
+    proxied = first.slice._proxied
+    assert isinstance(proxied, nodes.ClassDef)
+    assert proxied.qname() == "builtins.slice"
+    assert second.slice._proxied is proxied
+    assert first.slice.getattr("indices")
+
+
+def test_raises_not_implemented() -> None:
+    nodes_ = extract_node(
+        """
+        raise NotImplementedError #@
+        raise NotImplementedError("message") #@
+        raise errors.NotImplementedError() #@
+        raise ValueError() from NotImplementedError #@
+        raise TypeError(NotImplementedError) #@
+        raise ValueError("message") #@
+        raise #@
+        """
+    )
+    assert [node.raises_not_implemented() for node in nodes_] == [
+        True,
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
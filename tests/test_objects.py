@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
+import pickle
 import unittest
 
 from astroid import bases, builder, nodes, objects, util
 from astroid.exceptions import AttributeInferenceError, InferenceError, SuperError
+from astroid.manager import AstroidManager
 from astroid.objects import Super
 
 
@@ -50,6 +52,30 @@ class ObjectsTest(unittest.TestCase):
         )
         assert node.getattr("__new__")
 
+    def test_proxy_attribute_lookup(self) -> None:
+        """Attributes resolved through a proxy must track its current _proxied."""
+        module = builder.parse(
+            """
+        x = 1
+        y = [1, 2]
+        """
+        )
+        const = module.body[0].value
+        listnode = module.body[1].value
+        self.assertEqual(const.name, "int")
+        self.assertEqual(const.qname(), "builtins.int")
+        self.assertIs(listnode.locals, listnode._proxied.locals)
+        self.assertEqual(listnode.qname(), "builtins.list")
+        # Nodes that delegated attribute lookups can still be pickled.
+        self.assertTrue(pickle.dumps(module))
+
+        const.value = "s"
+        self.assertEqual(const.name, "str")
+        self.assertEqual(const.qname(), "builtins.str")
+
+        AstroidManager().clear_cache()
+        self.assertIs(listnode.locals, listnode._proxied.locals)
+
 
 class SuperTests(unittest.TestCase):
     def test_inferring_super_outside_methods(self) -> None: